@@ -0,0 +1,48 @@
+import io
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_transcript import audio as audio_module
+from youtube_transcript.audio import Audio
+from youtube_transcript.utils.exceptions import AudioDownloadError
+
+
+def test_pipe_to_wav_reaps_ffmpeg_that_exits_early(tmp_path, monkeypatch):
+    procs = []
+    popen = subprocess.Popen
+
+    def fake_popen(args, **kwargs):
+        # Stands in for an ffmpeg that rejects its input without reading it
+        proc = popen([sys.executable, '-c', 'import sys; sys.exit(3)'], **kwargs)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(audio_module.subprocess, 'Popen', fake_popen)
+    stream = io.BytesIO(b'\0' * (8 << 20))
+
+    with pytest.raises(AudioDownloadError):
+        Audio._pipe_to_wav(stream, str(tmp_path / 'out.wav'))
+
+    assert procs[0].returncode is not None
+    assert procs[0].stdin.closed
+
+
+def test_rate_limited_wav_download_resolves_video_once(tmp_path, monkeypatch):
+    video = SimpleNamespace(video_id='abc123', is_live=False, is_unavailable=False)
+    audio = Audio(
+        video,
+        audio_dir=str(tmp_path / 'audio'),
+        transcript_dir=str(tmp_path / 'text'),
+        max_rate=100000
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError('video should only be resolved by yt-dlp\'s pipeline')
+
+    monkeypatch.setattr(audio_module, 'get_ydl', fail)
+    monkeypatch.setattr(audio, '_download_ytdlp', lambda: True)
+
+    assert audio.download_wav()
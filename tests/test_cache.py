@@ -0,0 +1,17 @@
+from youtube_transcript.utils import cache
+
+
+def test_disk_memoize_reuses_results_and_schema(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    calls = []
+
+    @cache.disk_memoize('test', 60)
+    def double(x):
+        calls.append(x)
+        return {'value': x * 2}
+
+    assert double(2) == {'value': 4}
+    assert double(2) == {'value': 4}
+    assert double(3) == {'value': 6}
+    assert calls == [2, 3]
+    assert str(tmp_path / 'youtube-transcript' / 'memo.sqlite') in cache._memo_schema_paths
@@ -0,0 +1,106 @@
+import os
+import time
+
+import pytest
+
+from youtube_transcript import cli as cli_module
+from youtube_transcript.cli import YouTubeTranscriptCLI
+from youtube_transcript.utils.manifest import Manifest
+
+CHANNEL_URL = 'https://www.youtube.com/@example'
+
+
+def make_cli(tmp_path):
+    cli = YouTubeTranscriptCLI()
+    cli.args = cli.parse_args([CHANNEL_URL])
+    cli.manifest = Manifest(os.path.join(str(tmp_path), 'manifest.db'), CHANNEL_URL)
+    return cli
+
+
+def test_recorded_disabled_video_is_skipped(tmp_path, monkeypatch):
+    cli = make_cli(tmp_path)
+    cli.manifest.record('abc123', 'disabled')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('video should not be looked up')
+
+    monkeypatch.setattr(cli_module, 'Video', fail)
+    try:
+        result = cli._process_one({'id': 'abc123'}, False, None)
+    finally:
+        cli.manifest.close()
+
+    assert result == ('abc123', 'skipped', None, False, False)
+
+
+
+def test_videos_are_merged_in_channel_order_with_bounded_window(tmp_path, monkeypatch):
+    cli = make_cli(tmp_path)
+    cli.args.workers = 2
+    max_in_flight = cli.args.workers * 4
+    appended = []
+    in_flight = []
+
+    def process_one(entry, download_audio, cookies):
+        # Later videos finish first, so completion order is reversed
+        time.sleep(0.002 * (5 - entry['index'] % 5))
+        return entry['id'], 'success', {'video_id': entry['id']}, False, False
+
+    def videos():
+        for i in range(30):
+            in_flight.append(i - len(appended))
+            yield {'id': f'v{i}', 'index': i}
+
+    monkeypatch.setattr(cli, '_process_one', process_one)
+    monkeypatch.setattr(cli, '_append_transcript', lambda channel, data: appended.append(data['video_id']))
+    try:
+        total = cli._process_videos(videos(), None, False, None)
+    finally:
+        cli.manifest.close()
+
+    assert total == 30
+    assert appended == [f'v{i}' for i in range(30)]
+    assert max(in_flight) <= max_in_flight
+
+
+@pytest.mark.parametrize('value', ['0', '-2', 'many'])
+def test_workers_must_be_positive(value):
+    with pytest.raises(SystemExit):
+        YouTubeTranscriptCLI().parse_args([CHANNEL_URL, '--workers', value])
+
+
+class FakeAudio:
+    transcribed = []
+
+    def __init__(self, video, max_rate=None):
+        self.video = video
+        self.transcript_path = os.path.join(FakeAudio.transcript_dir, f'{video.video_id}.txt')
+
+    def download_wav(self):
+        return True
+
+    def transcribe(self):
+        FakeAudio.transcribed.append(self.video.video_id)
+        return True
+
+
+def test_recorded_disabled_video_retries_missing_audio_transcript(tmp_path, monkeypatch):
+    cli = make_cli(tmp_path)
+    cli.manifest.record('abc123', 'disabled')
+    cli.manifest.record('def456', 'disabled')
+    FakeAudio.transcript_dir = str(tmp_path)
+    FakeAudio.transcribed = []
+    with open(os.path.join(str(tmp_path), 'def456.txt'), 'w') as f:
+        f.write('already transcribed')
+
+    monkeypatch.setattr(cli_module, 'Audio', FakeAudio)
+    entry = {'title': 'Example', 'upload_date': '20240101'}
+    try:
+        retried = cli._process_one(dict(entry, id='abc123'), True, None)
+        settled = cli._process_one(dict(entry, id='def456'), True, None)
+    finally:
+        cli.manifest.close()
+
+    assert retried == ('abc123', 'disabled', None, True, True)
+    assert settled == ('def456', 'skipped', None, False, False)
+    assert FakeAudio.transcribed == ['abc123']
@@ -0,0 +1,62 @@
+import os
+
+from youtube_transcript.utils.file_splitter import FileSplitter
+
+
+def sections(content):
+    return [section for section, size in FileSplitter()._split_into_sections(content)]
+
+
+def test_markdown_h2_followed_by_any_whitespace_starts_a_section():
+    assert sections('intro\n## A\nx\n##\tB\n###C') == ['intro', '\n## A\nx', '\n##\tB\n###C']
+
+
+def test_html_h2_in_either_case_starts_a_section():
+    assert sections('<p>a</p><h2>A</h2><H2 id="b">B</H2>') == [
+        '<p>a</p>', '<h2>A</h2>', '<H2 id="b">B</H2>'
+    ]
+
+
+def test_content_without_h2_is_one_section():
+    assert sections('no headings here') == ['no headings here']
+
+
+def test_sections_are_packed_greedily(tmp_path):
+    splitter = FileSplitter(max_chars=10)
+    written = []
+
+    def open_next_file():
+        f = open(os.path.join(str(tmp_path), f'part{len(written)}'), 'w', encoding='utf-8')
+        written.append(f)
+        return f
+
+    pieces = [('aaaa', 4), ('bbbb', 4), ('cc', 2), ('dddddd', 6), ('e', 1)]
+    paths = list(splitter._emit_chunks(pieces, open_next_file))
+
+    contents = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            contents.append(f.read())
+    assert contents == ['aaaabbbbcc', 'dddddde']
+    assert all(f.closed for f in written)
+
+
+def test_split_file_writes_numbered_parts(tmp_path):
+    content = '# Title\n' + ''.join(f'\n## Video {i}\n\nSome text.\n' for i in range(6))
+    input_path = tmp_path / 'channel.md'
+    input_path.write_text(content, encoding='utf-8')
+    output_dir = tmp_path / 'parts'
+    output_dir.mkdir()
+
+    paths = FileSplitter(max_chars=60).split_file(str(input_path), str(output_dir))
+
+    assert [os.path.basename(p) for p in paths] == [
+        f'channel_part{i}.md' for i in range(1, len(paths) + 1)
+    ]
+    parts = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            parts.append(f.read())
+    assert ''.join(parts) == content
+    assert all(len(part) <= 60 for part in parts)
+    assert all(part.startswith('\n## ') for part in parts[1:])
@@ -0,0 +1,51 @@
+from youtube_transcript.output import HtmlStreamWriter, Output, _paragraphs
+from youtube_transcript.transcript import Transcript
+
+
+def captions(*texts):
+    return [{'text': text, 'start': float(i)} for i, text in enumerate(texts)]
+
+
+def test_paragraphs_break_after_sentence_endings():
+    items = captions('so this is', 'the start.', '  ', 'is it?', 'yes', 'it is!', 'and more')
+
+    assert list(_paragraphs(items)) == [
+        'so this is the start.', 'is it?', 'yes it is!', 'and more'
+    ]
+
+
+def test_paragraphs_skip_empty_and_missing_text():
+    assert list(_paragraphs([{'text': ''}, {'start': 1.0}, {'text': ' done. '}])) == ['done.']
+
+
+def test_html_writer_escapes_title_url_and_text(tmp_path):
+    path = str(tmp_path / 'out.html')
+    with HtmlStreamWriter(path, 'A & B <Channel>', 'https://youtube.com/@ab?x="1"') as writer:
+        writer.append({
+            'title': 'Tom & "Jerry" <live>',
+            'video_id': 'abc&d',
+            'published_date': '20240101',
+            'transcript': captions('1 < 2 & 3 > 2.', "it's fine")
+        })
+
+    with open(path, encoding='utf-8') as f:
+        html = f.read()
+
+    assert '<title>Transcripts for A &amp; B &lt;Channel&gt;</title>' in html
+    assert 'href="https://youtube.com/@ab?x=&quot;1&quot;"' in html
+    assert (
+        '<h2><a href="https://www.youtube.com/watch?v=abc&amp;d">'
+        'Tom &amp; &quot;Jerry&quot; &lt;live&gt;</a> 2024-01-01</h2>'
+    ) in html
+    assert '<p>1 &lt; 2 &amp; 3 &gt; 2.</p>' in html
+    assert '<p>it&#x27;s fine</p>' in html
+    assert html.endswith('</body>\n</html>')
+
+
+def test_markdown_and_transcripts_share_the_channel_username(tmp_path):
+    output = Output(str(tmp_path))
+    url = 'https://www.youtube.com/@example/videos'
+
+    assert output._markdown_path(url) == str(tmp_path / 'example.md')
+    assert Transcript.channel_subfolder(url, str(tmp_path)) == str(tmp_path / 'example')
+    assert output._markdown_path('https://www.youtube.com/channel/UC123') == str(tmp_path / 'channel.md')
@@ -0,0 +1,69 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api._errors import NoTranscriptFound, TranscriptsDisabled
+
+from youtube_transcript.transcript import Transcript
+
+CHANNEL_URL = 'https://www.youtube.com/@example'
+
+
+def make_transcript(tmp_path, video_id='abc123'):
+    video = SimpleNamespace(
+        video_id=video_id,
+        title='Example',
+        published_date='20240101',
+        channel_url=CHANNEL_URL,
+        is_live=False,
+        is_unavailable=False
+    )
+    return Transcript(video, output_dir=str(tmp_path))
+
+
+def test_legacy_json_is_read_and_migrated(tmp_path):
+    transcript = make_transcript(tmp_path)
+    folder = Transcript.channel_subfolder(CHANNEL_URL, str(tmp_path))
+    legacy_path = os.path.join(folder, 'abc123.json')
+    data = {
+        'title': 'Example',
+        'video_id': 'abc123',
+        'published_date': '20240101',
+        'transcript': [{'text': 'Hello there.', 'start': 0.0}]
+    }
+    with open(legacy_path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+    assert Transcript.preload_existing(folder) == {'abc123'}
+    assert transcript.download(Transcript.preload_existing(folder)) == ('skipped', data)
+    assert not os.path.exists(legacy_path)
+    assert os.path.exists(transcript.transcript_path)
+    assert make_transcript(tmp_path).get_transcript_text() == 'Hello there.'
+
+
+@pytest.mark.parametrize('error, status', [
+    (TranscriptsDisabled('abc123'), 'disabled'),
+    (NoTranscriptFound('abc123', ['en'], None), 'not_found'),
+    (RuntimeError('HTTP Error 429'), 'error'),
+])
+def test_download_maps_api_errors_to_statuses(tmp_path, monkeypatch, error, status):
+    def get_transcript(video_id):
+        raise error
+
+    monkeypatch.setattr(
+        YouTubeTranscriptApi, 'get_transcript', staticmethod(get_transcript), raising=False
+    )
+
+    assert make_transcript(tmp_path).download() == (status, None)
+
+
+def test_error_types_map_to_manifest_statuses(tmp_path):
+    transcript = make_transcript(tmp_path)
+
+    assert transcript._save_error_status('transcripts_disabled') == ('disabled', None)
+    assert transcript._save_error_status('no_transcript_found') == ('not_found', None)
+    assert transcript._save_error_status('video_unavailable') == ('unavailable', None)
+    assert transcript._save_error_status('live_event') == ('live', None)
+    assert transcript._save_error_status('HTTP Error 429') == ('error', None)
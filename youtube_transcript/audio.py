@@ -1,20 +1,40 @@
 import os
+import shutil
 import subprocess
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Tuple, Dict, Any
 import speech_recognition as sr
 import yt_dlp
 from .video import Video
+from .utils.ffmpeg_pool import FfmpegPool
+from .utils.ydl_pool import get_ydl
 from .utils.exceptions import (
     AudioDownloadError,
     TranscriptionError,
     InvalidVideoError
 )
 
+# Google's synchronous recognition endpoint rejects audio longer than a minute
+CHUNK_SECONDS = 55
+
+# Shared across all Audio instances so concurrent transcriptions don't
+# oversubscribe the CPU with ffmpeg processes
+_FFMPEG_POOL = FfmpegPool(workers=4, segment_time=CHUNK_SECONDS)
+
+# Pipe buffer size for streaming audio into ffmpeg (the OS default is tiny)
+PIPE_BUFFER_SIZE = 1 << 20
+
 
 class Audio:
     """Handles YouTube audio downloading and transcription."""
     
-    def __init__(self, video: Video, audio_dir: str = 'audio_files', transcript_dir: str = 'audio_transcripts'):
+    def __init__(
+        self,
+        video: Video,
+        audio_dir: str = 'audio_files',
+        transcript_dir: str = 'audio_transcripts',
+        max_rate: Optional[int] = None
+    ):
         """
         Initialize with a Video instance and output directories.
         
@@ -22,10 +42,14 @@ class Audio:
             video: Video instance
             audio_dir: Directory for storing downloaded audio files
             transcript_dir: Directory for storing audio transcriptions
+            max_rate: Maximum download rate in bytes per second. Staying
+                under YouTube's per-connection throttle avoids the slow
+                throttled downloads and retries that cost more overall
         """
         self.video = video
         self.audio_dir = audio_dir
         self.transcript_dir = transcript_dir
+        self.max_rate = max_rate
         os.makedirs(audio_dir, exist_ok=True)
         os.makedirs(transcript_dir, exist_ok=True)
         
@@ -34,11 +58,28 @@ class Audio:
         """Get path to audio file for this video."""
         return os.path.join(self.audio_dir, f'{self.video.video_id}.mp3')
         
+    @property
+    def wav_path(self) -> str:
+        """Get path to the 16 kHz mono WAV used for speech recognition."""
+        return os.path.join(self.audio_dir, f'{self.video.video_id}.wav')
+        
     @property
     def transcript_path(self) -> str:
         """Get path to transcript file for this video."""
         return os.path.join(self.transcript_dir, f'{self.video.video_id}.txt')
         
+    def _network_opts(self) -> Dict[str, Any]:
+        """Get yt-dlp options for rate limiting and bounded retries."""
+        opts = {
+            'retries': 3,
+            'fragment_retries': 3,
+            'socket_timeout': 10
+        }
+        if self.max_rate:
+            opts['ratelimit'] = self.max_rate
+            opts['throttledratelimit'] = self.max_rate // 2
+        return opts
+        
     def download(self) -> bool:
         """
         Download audio for the video.
@@ -52,7 +93,33 @@ class Audio:
         if self.video.is_live or self.video.is_unavailable:
             return False
             
-        # Try multiple download approaches
+        # Fetch a single progressive stream directly when possible
+        try:
+            if self._download_direct():
+                return True
+        except yt_dlp.DownloadError as e:
+            if 'age restricted' in str(e).lower():
+                raise AudioDownloadError(
+                    "Age-restricted video. Provide cookies for authentication."
+                ) from e
+        except (OSError, subprocess.CalledProcessError, yt_dlp.utils.YoutubeDLError):
+            pass  # Network or ffmpeg failure; fall back to the yt-dlp pipeline below
+            
+        return self._download_ytdlp()
+        
+    def _download_ytdlp(self) -> bool:
+        """
+        Download audio to the MP3 path through yt-dlp's download pipeline.
+        
+        Handles every stream type yt-dlp supports, including fragmented
+        DASH and HLS formats.
+        
+        Returns:
+            True if audio was downloaded successfully, False otherwise
+        """
+        # Try multiple download approaches. The output template uses %(id)s
+        # rather than the literal ID so the options, and therefore the
+        # cached YoutubeDL instances, are shared across videos
         attempts = [
             {
                 'format': 'bestaudio/best',
@@ -60,13 +127,15 @@ class Audio:
                     'key': 'FFmpegExtractAudio',
                     'preferredcodec': 'mp3',
                 }],
-                'outtmpl': f'{self.audio_dir}/{self.video.video_id}.%(ext)s',
-                'quiet': True
+                'outtmpl': f'{self.audio_dir}/%(id)s.%(ext)s',
+                'quiet': True,
+                **self._network_opts()
             },
             {
                 'format': 'm4a/bestaudio/best',
-                'outtmpl': f'{self.audio_dir}/{self.video.video_id}.%(ext)s',
-                'quiet': True
+                'outtmpl': f'{self.audio_dir}/%(id)s.%(ext)s',
+                'quiet': True,
+                **self._network_opts()
             }
         ]
 
@@ -76,9 +145,9 @@ class Audio:
                 ydl_opts['cookiefile'] = self.video.cookies
                 
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([self.video.url])
-                
+                ydl = get_ydl(ydl_opts)
+                ydl.download([self.video.url])
+
                 # Check if any file was downloaded
                 if os.path.exists(self.audio_path):
                     return True
@@ -94,64 +163,278 @@ class Audio:
                 
         return False
         
-    def transcribe(self) -> bool:
+    def _download_direct(self) -> bool:
         """
-        Transcribe downloaded audio to text.
+        Download a single progressive audio stream with one HTTP GET.
+        
+        Skips yt-dlp's download pipeline (fragment bookkeeping, postprocessor
+        setup) for the common case where the best audio format is a plain
+        HTTP URL. The stream is saved next to the MP3 and converted by ffmpeg.
         
         Returns:
-            True if transcription was successful, False otherwise
+            True if the MP3 was created, False if the stream isn't a single
+            progressive download and the regular path should be used
         """
-        if not os.path.exists(self.audio_path):
+        # urlopen bypasses yt-dlp's rate limiter, so honor --max-rate by
+        # leaving capped downloads to the regular path
+        if self.max_rate:
             return False
             
-        if os.path.exists(self.transcript_path):
-            return True
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'quiet': True,
+            'skip_download': True,
+            **self._network_opts()
+        }
+        if self.video.cookies:
+            ydl_opts['cookiefile'] = self.video.cookies
             
-        # Convert MP3 to WAV format for speech recognition
-        wav_path = os.path.join(self.audio_dir, f'{self.video.video_id}.wav')
+        ydl = get_ydl(ydl_opts)
+        info = ydl.extract_info(self.video.url, download=False)
+        if not info.get('url') or info.get('protocol') not in ('http', 'https'):
+            return False
+            
+        raw_path = f'{self.audio_path}.raw'
+        part_path = f'{self.audio_path}.part'
         try:
+            response = ydl.urlopen(info['url'])
+            try:
+                with open(raw_path, 'wb') as f:
+                    shutil.copyfileobj(response, f, PIPE_BUFFER_SIZE)
+            finally:
+                response.close()
+                
+            # Convert to a temporary file so a failed or interrupted
+            # conversion never leaves a truncated MP3 in place
             subprocess.run([
                 'ffmpeg',
-                '-y',  # Overwrite without asking
-                '-i', self.audio_path,
-                '-acodec', 'pcm_s16le',  # WAV format
-                '-ac', '1',  # Mono channel
-                '-ar', '16000',  # 16kHz sample rate
-                wav_path
+                '-nostdin',
+                '-y',
+                '-i', raw_path,
+                '-vn',
+                '-acodec', 'libmp3lame',
+                '-f', 'mp3',
+                part_path
             ], check=True)
+            os.replace(part_path, self.audio_path)
+        finally:
+            for path in (raw_path, part_path):
+                if os.path.exists(path):
+                    os.remove(path)
+                    
+        return True
+        
+    @staticmethod
+    def _pipe_to_wav(stream: Any, wav_path: str) -> None:
+        """
+        Convert an audio stream to 16 kHz mono WAV by piping it through ffmpeg.
+        
+        Args:
+            stream: File-like object the audio is read from
+            wav_path: Path of the WAV file to write
+            
+        Raises:
+            AudioDownloadError: If ffmpeg fails or exits before reading the
+                whole stream
+        """
+        proc = subprocess.Popen([
+            'ffmpeg',
+            '-nostdin',
+            '-hide_banner',
+            '-loglevel', 'error',
+            '-y',
+            '-i', 'pipe:0',
+            '-acodec', 'pcm_s16le',  # WAV format
+            '-ac', '1',  # Mono channel
+            '-ar', '16000',  # 16kHz sample rate
+            '-f', 'wav',
+            wav_path
+        ], stdin=subprocess.PIPE, bufsize=PIPE_BUFFER_SIZE)
+        try:
+            shutil.copyfileobj(stream, proc.stdin, PIPE_BUFFER_SIZE)
+            proc.stdin.close()
+        except BaseException as e:
+            # Never leave ffmpeg running or unreaped; closing stdin can raise
+            # again while flushing into a pipe ffmpeg has already closed
+            proc.kill()
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+            proc.wait()
+            if isinstance(e, BrokenPipeError):
+                raise AudioDownloadError(
+                    f"ffmpeg exited early with status {proc.returncode}"
+                ) from e
+            raise
+            
+        if proc.wait() != 0:
+            raise AudioDownloadError(f"ffmpeg exited with status {proc.returncode}")
+            
+    def download_wav(self) -> bool:
+        """
+        Stream the best audio track straight into a WAV ready for transcription.
+        
+        Unlike download(), no MP3 is written: the audio stream is piped
+        into a single ffmpeg process that emits 16 kHz mono PCM. Streams
+        that are not a single HTTP download (DASH, HLS), and all downloads
+        when max_rate is set, are fetched as an MP3 through yt-dlp instead,
+        which transcribe() also accepts.
+        
+        Returns:
+            True if the WAV or MP3 is available, False otherwise
+        """
+        if (os.path.exists(self.transcript_path) or os.path.exists(self.wav_path)
+                or os.path.exists(self.audio_path)):
+            return True
+            
+        if self.video.is_live or self.video.is_unavailable:
+            return False
+            
+        # urlopen bypasses yt-dlp's rate limiter and retries, so capped
+        # downloads go straight to the regular pipeline without resolving
+        # the video twice
+        if self.max_rate:
+            return self._download_ytdlp()
+            
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'quiet': True,
+            'skip_download': True,
+            **self._network_opts()
+        }
+        if self.video.cookies:
+            ydl_opts['cookiefile'] = self.video.cookies
+            
+        temp_path = f'{self.wav_path}.tmp'
+        try:
+            ydl = get_ydl(ydl_opts)
+            info = ydl.extract_info(self.video.url, download=False)
+            if not info.get('url'):
+                return False
+                
+            # Fragmented formats would pipe a manifest, not audio, into
+            # ffmpeg, so they are left to the regular download pipeline
+            if info.get('protocol') not in ('http', 'https'):
+                return self._download_ytdlp()
+                
+            response = ydl.urlopen(info['url'])
+            try:
+                self._pipe_to_wav(response, temp_path)
+            finally:
+                response.close()
+                
+            os.replace(temp_path, self.wav_path)
+            return True
+            
+        except yt_dlp.DownloadError as e:
+            if 'age restricted' in str(e).lower():
+                raise AudioDownloadError(
+                    "Age-restricted video. Provide cookies for authentication."
+                ) from e
+            return False
+        except AudioDownloadError:
+            raise
         except Exception as e:
-            raise TranscriptionError(f"Failed to convert audio to WAV format: {e}") from e
+            raise AudioDownloadError(f"Audio download failed: {e}") from e
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+    def transcribe(self) -> bool:
+        """
+        Transcribe downloaded audio to text.
+        
+        Returns:
+            True if transcription was successful, False otherwise
+        """
+        if os.path.exists(self.transcript_path):
+            return True
             
-        recognizer = sr.Recognizer()
-        for _ in range(3):  # Retry up to 3 times
+        wav_path = self.wav_path
+        source_path = wav_path if os.path.exists(wav_path) else self.audio_path
+        if not os.path.exists(source_path):
+            return False
+            
+        # Convert to 16kHz mono WAV and split into chunks that fit the
+        # synchronous recognition limit, in a single ffmpeg run
+        chunks_dir = os.path.join(self.audio_dir, f'{self.video.video_id}_chunks')
+        written = False
+        try:
+            os.makedirs(chunks_dir, exist_ok=True)
             try:
-                with sr.AudioFile(wav_path) as source:
-                    # Adjust for ambient noise and read the entire file
-                    recognizer.adjust_for_ambient_noise(source)
-                    audio = recognizer.record(source)
-                    
-                    try:
-                        text = recognizer.recognize_google(audio, show_all=False)
-                    except sr.UnknownValueError:
-                        raise TranscriptionError("Speech recognition could not understand audio")
-                    except sr.RequestError as e:
-                        raise TranscriptionError(f"Speech recognition service error: {e}")
-                        
-                with open(self.transcript_path, 'w') as f:
-                    f.write(text)
+                _FFMPEG_POOL.submit(source_path, os.path.join(chunks_dir, '%04d.wav')).result()
+            except Exception as e:
+                raise TranscriptionError(f"Failed to convert audio to WAV chunks: {e}") from e
+                
+            chunk_paths = sorted(
+                os.path.join(chunks_dir, name)
+                for name in os.listdir(chunks_dir)
+                if name.endswith('.wav')
+            )
+            
+            if not chunk_paths:
+                return False
+                
+            # Recognize chunks concurrently, keeping results in chunk order
+            texts = [None] * len(chunk_paths)
+            try:
+                with ThreadPoolExecutor(max_workers=8) as ex:
+                    futures = {
+                        ex.submit(self._transcribe_chunk, path): i
+                        for i, path in enumerate(chunk_paths)
+                    }
+                    for future in as_completed(futures):
+                        texts[futures[future]] = future.result()
+            except TranscriptionError:
+                return False
                     
-                # Clean up temporary WAV file
+            with open(self.transcript_path, 'w') as f:
+                f.write(' '.join(text for text in texts if text))
+            written = True
+            
+            return True
+            
+        finally:
+            # Clean up temporary WAV files; the full WAV is kept until a
+            # transcript is written so a later run can retry recognition
+            shutil.rmtree(chunks_dir, ignore_errors=True)
+            if written:
                 try:
                     os.remove(wav_path)
-                except:
+                except OSError:
                     pass
+                
+    def _transcribe_chunk(self, chunk_path: str) -> str:
+        """
+        Transcribe a single WAV chunk, retrying on failure.
+        
+        Args:
+            chunk_path: Path to the WAV chunk
+            
+        Returns:
+            Recognized text, or an empty string if the chunk contains no speech
+        """
+        # record() and recognize_google() don't use the energy threshold, so
+        # there is no ambient-noise calibration to do
+        recognizer = sr.Recognizer()
+        last_error = None
+        for _ in range(3):  # Retry up to 3 times
+            try:
+                with sr.AudioFile(chunk_path) as source:
+                    # Read the entire chunk
+                    audio = recognizer.record(source)
                     
-                return True
+                return recognizer.recognize_google(audio, show_all=False)
                 
+            except sr.UnknownValueError:
+                return ''
+            except sr.RequestError as e:
+                last_error = TranscriptionError(f"Speech recognition service error: {e}")
             except Exception as e:
-                continue
+                last_error = TranscriptionError(f"Failed to transcribe audio chunk: {e}")
                 
-        return False
+        raise last_error
         
     def get_transcription(self) -> Optional[str]:
         """Get the transcription text if available."""
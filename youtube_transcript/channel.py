@@ -1,23 +1,40 @@
 import os
+import re
 import time
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict, Any, Iterator
 import yt_dlp
+from .utils.cache import cached_channel_info
+from .utils.ydl_pool import get_ydl
 from .utils.exceptions import ChannelInfoError, VideoFetchError
 
+# Matches server-side HTTP failures worth retrying
+_TRANSIENT_ERROR_RE = re.compile(r'HTTP Error 5\d\d')
+
 
 class Channel:
     """Handles YouTube channel information and video listing operations."""
     
-    def __init__(self, url: str, cookies: Optional[str] = None):
+    def __init__(
+        self,
+        url: str,
+        cookies: Optional[str] = None,
+        request_sleep: float = 0.25,
+        use_cache: bool = True
+    ):
         """
         Initialize with channel URL and optional cookies file.
         
         Args:
             url: YouTube channel URL
             cookies: Path to cookies file for authenticated requests
+            request_sleep: Seconds yt-dlp sleeps between its internal HTTP
+                requests, to stay under YouTube's bot detection
+            use_cache: Whether to reuse the channel ID and name cached on disk
         """
         self.url = url
         self.cookies = cookies
+        self.request_sleep = request_sleep
+        self.use_cache = use_cache
         self._id = None
         self._name = None
         
@@ -35,36 +52,46 @@ class Channel:
             self._fetch_channel_info()
         return self._name
         
+    @cached_channel_info
     def _fetch_channel_info(self) -> None:
         """Fetch and cache channel ID and name."""
         ydl_opts = {
             'quiet': True,
             'extract_flat': True,
-            'skip_download': True
+            'skip_download': True,
+            **self._sleep_opts()
         }
         
         if self.cookies:
             ydl_opts['cookiefile'] = self.cookies
             
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=False)
-                
-                # Handle different channel URL formats
-                if info.get('channel_id'):
-                    self._id = info['channel_id']
-                elif info.get('uploader_id'):
-                    self._id = info['uploader_id']
-                else:
-                    raise ChannelInfoError("Could not determine channel ID")
-                    
-                # Get channel name (fall back to uploader if needed)
-                self._name = info.get('channel', info.get('uploader', 'Unknown Channel'))
+            ydl = get_ydl(ydl_opts)
+            info = ydl.extract_info(self.url, download=False)
+            
+            # Handle different channel URL formats
+            if info.get('channel_id'):
+                self._id = info['channel_id']
+            elif info.get('uploader_id'):
+                self._id = info['uploader_id']
+            else:
+                raise ChannelInfoError("Could not determine channel ID")
                 
+            # Get channel name (fall back to uploader if needed)
+            self._name = info.get('channel', info.get('uploader', 'Unknown Channel'))
+            
         except Exception as e:
             raise ChannelInfoError(f"Error getting channel info: {e}") from e
             
-    def get_videos_page(self, page_token: Optional[str] = None, max_per_page: int = 100) -> Tuple[List[str], Optional[str]]:
+    def _sleep_opts(self) -> Dict[str, Any]:
+        """Get yt-dlp options that pace requests to avoid throttling."""
+        return {
+            'sleep_interval_requests': self.request_sleep,
+            'sleep_interval': 1,
+            'max_sleep_interval': 3
+        }
+        
+    def get_videos_page(self, page_token: Optional[str] = None, max_per_page: int = 100) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
         Get a single page of videos from channel.
         
@@ -73,7 +100,9 @@ class Channel:
             max_per_page: Maximum number of videos to return per page
             
         Returns:
-            Tuple of (video_urls, next_page_token)
+            Tuple of (video_entries, next_page_token). Each entry is the flat
+            yt-dlp playlist entry (id, url, title, live_status, availability,
+            approximate timestamp, ...)
         """
         if not self.id:
             return [], None
@@ -83,7 +112,9 @@ class Channel:
         retry_delay = 5  # seconds between retries
         
         ydl_opts = {
-            'extract_flat': True,
+            # Keep playlist entries flat but with their listing metadata, so
+            # videos don't each need their own extract_info call
+            'extract_flat': 'in_playlist',
             'quiet': True,
             # 'playlist_items': f'1-{max_per_page}',
             'extractor_args': {
@@ -91,8 +122,14 @@ class Channel:
                     'player_client': 'all',
                     'player_skip': ['webpage'],
                     'max_videos': max_per_page
+                },
+                # Flat entries only carry a date when it is derived from the
+                # listing's relative upload time ("3 weeks ago")
+                'youtubetab': {
+                    'approximate_date': ['']
                 }
-            }
+            },
+            **self._sleep_opts()
         }
         
         if self.cookies:
@@ -106,40 +143,53 @@ class Channel:
         # Retry logic with delays    
         for attempt in range(max_retries):
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(base_url, download=False)
-                    if not info.get('entries'):
-                        if attempt < max_retries - 1:
-                            time.sleep(retry_delay)
-                            continue
-                        return [], None
-                    
-                    videos = [f"https://youtu.be/{entry['id']}" for entry in info['entries']]
-                    next_page = info.get('continuation')
-                    return videos, next_page
-                    
-            except Exception as e:
-                if attempt < max_retries - 1:
+                ydl = get_ydl(ydl_opts, volatile=('extractor_args',))
+                info = ydl.extract_info(base_url, download=False)
+                if not info.get('entries'):
+                    if attempt < max_retries - 1:
+                        time.sleep(retry_delay)
+                        continue
+                    return [], None
+                
+                videos = list(info['entries'])
+                next_page = info.get('continuation')
+                return videos, next_page
+                
+            except (yt_dlp.utils.ExtractorError, yt_dlp.utils.DownloadError) as e:
+                # Only server-side failures are worth retrying; yt-dlp
+                # already paces its own requests
+                if attempt < max_retries - 1 and _TRANSIENT_ERROR_RE.search(str(e)):
                     time.sleep(retry_delay)
                     continue
-                raise VideoFetchError(f"Failed to get videos after {max_retries} attempts: {e}") from e
+                raise VideoFetchError(f"Failed to get videos after {attempt + 1} attempts: {e}") from e
+            except Exception as e:
+                raise VideoFetchError(f"Failed to get videos: {e}") from e
         
         return [], None
 
-    def get_all_videos(self) -> List[str]:
+    def iter_all_videos(self) -> Iterator[Dict[str, Any]]:
         """
-        Get all videos from channel using pagination.
+        Iterate over all videos from channel, fetching pages lazily.
         
-        Returns:
-            List of all video URLs
+        Entries from a page are yielded before the next page is requested,
+        so callers can start processing while pagination continues.
+        
+        Yields:
+            Video entries
         """
-        all_videos = []
         next_page = None
         
         while True:
             page_videos, next_page = self.get_videos_page(next_page)
-            all_videos.extend(page_videos)
+            yield from page_videos
             if not next_page:
                 break
                 
-        return all_videos
+    def get_all_videos(self) -> List[Dict[str, Any]]:
+        """
+        Get all videos from channel using pagination.
+        
+        Returns:
+            List of all video entries
+        """
+        return list(self.iter_all_videos())
@@ -2,19 +2,25 @@ import os
 import sys
 import time
 import argparse
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
+import yt_dlp
 from .channel import Channel
 from .video import Video
 from .transcript import Transcript
 from .audio import Audio
 from .output import Output
+from .utils.manifest import Manifest, TERMINAL_STATUSES
+from .utils import ydl_pool
 from .utils.exceptions import (
     YouTubeTranscriptError,
     ChannelInfoError,
     VideoFetchError,
     TranscriptError,
-    AudioDownloadError
+    AudioDownloadError,
+    TranscriptionError
 )
 
 
@@ -46,9 +52,14 @@ class YouTubeTranscriptCLI:
             'not_found': 0,
             'not_found_with_audio': 0,
             'error': 0,
-            'live': 0
+            'live': 0,
+            'unavailable': 0,
+            'audio_transcripts': 0
         }
-        self.successful_transcripts = []
+        self._output_stream = None
+        self._lock = threading.Lock()
+        self.manifest = None
+        self._existing = None
         
     def parse_args(self, args: List[str] = None) -> argparse.Namespace:
         """Parse command line arguments."""
@@ -65,8 +76,35 @@ class YouTubeTranscriptCLI:
         parser.add_argument('--output-format', choices=['markdown', 'html'], default='markdown',
                           help='Output format for merged transcripts')
         parser.add_argument('--output-file', help='Custom output filename (without extension)')
+        parser.add_argument('--workers', type=self._parse_workers, default=8,
+                          help='Number of videos to process concurrently (default: 8)')
+        parser.add_argument('--request-sleep', type=float, default=0.25,
+                          help='Seconds to sleep between yt-dlp requests when listing the channel (default: 0.25)')
+        parser.add_argument('--max-rate', type=self._parse_rate, metavar='BYTES_PER_SEC',
+                          help='Maximum audio download rate per video, e.g. 2M')
+        parser.add_argument('--no-channel-cache', action='store_true',
+                          help='Ignore the cached channel ID/name and fetch it again')
         return parser.parse_args(args)
         
+    @staticmethod
+    def _parse_workers(value: str) -> int:
+        """Parse a worker count, which must be a positive integer."""
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            raise argparse.ArgumentTypeError(f"must be a positive integer: '{value}'")
+        return workers
+        
+    @staticmethod
+    def _parse_rate(value: str) -> int:
+        """Parse a byte rate such as '500K' or '2M' into bytes per second."""
+        rate = yt_dlp.utils.parse_bytes(value)
+        if not rate:
+            raise argparse.ArgumentTypeError(f"invalid rate: '{value}'")
+        return rate
+        
     def run(self, args: List[str] = None) -> int:
         """Main entry point for the CLI application."""
         start_time = time.time()
@@ -77,49 +115,57 @@ class YouTubeTranscriptCLI:
             cookies_file = self._handle_cookies(self.args)
             
             # Initialize channel
-            channel = Channel(self.args.channel_url, cookies_file)
+            channel = Channel(
+                self.args.channel_url,
+                cookies_file,
+                request_sleep=self.args.request_sleep,
+                use_cache=not self.args.no_channel_cache
+            )
             self._update_progress(channel_url=self.args.channel_url)
             
             print(f"Processing channel: {self.args.channel_url}")
             self._print_channel_info(channel)
             
-            # Fetch all videos
-            video_urls = self._fetch_all_videos(channel)
-            if not video_urls:
+            # Open manifest of previously processed videos
+            self.manifest = Manifest(os.path.join('output', 'manifest.db'), self.args.channel_url)
+            self._existing = Transcript.preload_existing(
+                Transcript.channel_subfolder(self.args.channel_url)
+            )
+            
+            # Process each video as the channel pages arrive
+            total_videos = self._process_videos(
+                self._iter_videos(channel), channel, self.args.audio, cookies_file
+            )
+            if not total_videos:
                 print("No videos found for this channel")
                 return 1
                 
-            print(f"\nFound {len(video_urls)} videos to process")
-            self._update_progress(total_videos=len(video_urls), status='processing')
-            
-            # Process each video
-            self._process_videos(video_urls, channel, self.args.audio, cookies_file)
-            
             # Print summary
             self._print_summary(self.args.audio)
             
-            # Process audio transcripts if requested
-            if self.args.audio:
-                self._process_audio_transcripts(video_urls)
-                
-            # Create merged output file
-            output_file = self._create_output_file(channel.name, self.args.channel_url, self.args.output_format, self.args.output_file)
+            # Finalize merged output file
+            output_file = self._close_output_file()
             if output_file:
                 print(f"\nTranscripts merged into: {output_file}")
                 
         except KeyboardInterrupt:
             print("\nProcess interrupted. Partial results saved.")
             self._update_progress(status='interrupted')
-            if self.successful_transcripts:
-                output_file = self._create_output_file(
-                    channel.name, self.args.channel_url, self.args.output_format, self.args.output_file
-                )
+            if self._output_stream:
+                output_file = self._close_output_file()
                 if output_file:
                     print(f"Partial transcripts merged into: {output_file}")
             return 1
         except YouTubeTranscriptError as e:
             print(f"\nError: {e}", file=sys.stderr)
             return 1
+        finally:
+            if self.manifest:
+                self.manifest.close()
+            if self._output_stream:
+                self._output_stream.close()
+            # Saves cookie jars, as closing each YoutubeDL used to
+            ydl_pool.close_all()
             
         elapsed = time.time() - start_time
         print(f"\nTotal execution time: {timedelta(seconds=elapsed)}")
@@ -180,126 +226,215 @@ class YouTubeTranscriptCLI:
             print(f"- ID: {channel.id}")
         print(f"- Name: {channel.name}")
         
-    def _fetch_all_videos(self, channel: Channel) -> List[str]:
-        """Fetch all videos from channel with progress reporting."""
+    def _iter_videos(self, channel: Channel) -> Iterator[Dict[str, Any]]:
+        """Iterate over all videos from channel, reporting fetch errors."""
         print("Starting to fetch all videos from channel")
         
         try:
-            # Use the improved get_all_videos method
-            all_videos = channel.get_all_videos()
-            
-            if not all_videos:
-                print("No videos found for this channel")
-                return []
-                
-            print(f"Successfully fetched {len(all_videos)} videos from channel")
-            return all_videos
-            
+            yield from channel.iter_all_videos()
         except Exception as e:
             print(f"Error fetching videos: {e}")
-            return []
             
+    def _process_videos(self, videos: Iterable[Dict[str, Any]], channel: Channel, download_audio: bool, cookies: Optional[str]) -> int:
+        """
+        Process each video in the channel using a pool of worker threads.
+        
+        Videos are submitted as they are read from ``videos``, so workers
+        start downloading while later channel pages are still being fetched,
+        and finished transcripts are merged into the output file in channel
+        order as soon as every earlier video is done. At most a few videos
+        per worker are in flight or waiting to be written at any time.
         
-    def _process_videos(self, video_urls: List[str], channel: Channel, download_audio: bool, cookies: Optional[str]) -> None:
-        """Process each video in the channel."""
+        Returns:
+            Number of videos processed
+        """
         start_time = time.time()
-        total_videos = len(video_urls)
+        completed = 0
+        total_videos = None
+        max_in_flight = self.args.workers * 4
         
-        print(f"\nStarting to process {total_videos} videos...")
+        print(f"\nStarting to process videos with {self.args.workers} workers...")
         
-        for i, url in enumerate(video_urls, 1):
-            video_id = url.split('/')[-1]
-            video = Video(video_id, cookies, self.args.channel_url)
-            transcript = Transcript(video)
+        ex = ThreadPoolExecutor(max_workers=self.args.workers)
+        futures = {}
+        
+        # Finished transcripts wait here until every earlier video is done
+        pending = {}
+        next_index = 0
+        
+        def consume(done: Iterable[Future]) -> None:
+            nonlocal completed, next_index
+            with self._lock:
+                for future in done:
+                    index, video_id = futures.pop(future)
+                    pending[index] = self._collect_result(future, video_id)
+                    completed += 1
+                    self._print_progress(completed, total_videos or len(futures) + completed, video_id, start_time)
+                    
+                # Write out every transcript that is now next in channel order
+                while next_index in pending:
+                    ready = pending.pop(next_index)
+                    next_index += 1
+                    if ready:
+                        self._append_transcript(channel, ready)
+                        
+        try:
+            submitted = 0
+            for entry in videos:
+                while submitted - next_index >= max_in_flight:
+                    consume(wait(futures, return_when=FIRST_COMPLETED).done)
+                    
+                future = ex.submit(self._process_one, entry, download_audio, cookies)
+                futures[future] = (submitted, entry['id'])
+                submitted += 1
+                
+                # Pick up finished work without blocking the channel scan
+                consume([f for f in futures if f.done()])
+                
+            total_videos = submitted
+            if total_videos:
+                print(f"\nFound {total_videos} videos to process")
+                self._update_progress(total_videos=total_videos, status='processing')
+                
+            while futures:
+                consume(wait(futures, return_when=FIRST_COMPLETED).done)
+                
+        except KeyboardInterrupt:
+            # Drop queued videos so the interrupt takes effect promptly
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            ex.shutdown(wait=True)
             
-            # Calculate progress metrics
-            elapsed = time.time() - start_time
-            avg_time_per_video = elapsed / i if i > 1 else 0
-            remaining = avg_time_per_video * (total_videos - i)
+        return total_videos
+        
+    def _collect_result(self, future: Future, video_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Record the outcome of a finished video in the statistics.
+        
+        Returns:
+            Transcript data to merge into the output file, if any
+        """
+        try:
+            video_id, status, transcript_data, audio_ok, transcribed = future.result()
+        except Exception as e:
+            print(f"\n⚠️ Skipping video {video_id} due to error: {str(e)}")
+            self.stats['skipped'] += 1
+            self.progress['failed'].append({
+                'video_id': video_id,
+                'error': str(e),
+                'retry': True
+            })
+            return None
             
-            video_title = video.title if hasattr(video, 'title') and video.title else video_id
-            spin_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-            spin_char = spin_chars[int(time.time() * 10) % len(spin_chars)]
-            progress_line = f"\r{spin_char} Processing: {i}/{total_videos} ({i/total_videos:.1%}) | {video_title[:30]} | "
-            progress_line += f"Time: {timedelta(seconds=int(elapsed))} | Est: ~{timedelta(seconds=int(remaining))}"
+        self._update_stats(status)
+        
+        if audio_ok:
+            if status == 'disabled':
+                self.stats['disabled_with_audio'] += 1
+                self.stats['disabled'] -= 1
+            else:
+                self.stats['not_found_with_audio'] += 1
+                self.stats['not_found'] -= 1
+                
+        if transcribed:
+            self.stats['audio_transcripts'] += 1
             
-            # Print the combined line
-            sys.stdout.write(progress_line)
-            sys.stdout.flush()
+        return transcript_data
+        
+    def _print_progress(self, completed: int, total_videos: int, video_id: str, start_time: float) -> None:
+        """Print the progress line and update the progress record."""
+        # Calculate progress metrics
+        elapsed = time.time() - start_time
+        avg_time_per_video = elapsed / completed
+        remaining = avg_time_per_video * (total_videos - completed)
+        
+        spin_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+        spin_char = spin_chars[int(time.time() * 10) % len(spin_chars)]
+        progress_line = f"\r{spin_char} Processing: {completed}/{total_videos} ({completed/total_videos:.1%}) | {video_id[:30]} | "
+        progress_line += f"Time: {timedelta(seconds=int(elapsed))} | Est: ~{timedelta(seconds=int(remaining))}"
+        
+        sys.stdout.write(progress_line)
+        sys.stdout.flush()
+        
+        # Update progress
+        self._update_progress(
+            completed=completed,
+            last_processed=video_id,
+            status=f'processing {completed}/{total_videos}',
+            stats=self.stats
+        )
+        
+    def _process_one(self, entry: Dict[str, Any], download_audio: bool, cookies: Optional[str]) -> Tuple[str, str, Optional[Dict[str, Any]], bool, bool]:
+        """
+        Download the transcript (and optionally audio) for a single video.
+        
+        When the transcript is unavailable and audio is requested, the audio
+        is downloaded and transcribed on the same worker.
+        
+        Runs on a worker thread, so it must not touch shared CLI state.
+        
+        Returns:
+            Tuple of (video_id, status, transcript_data, audio_ok, audio_transcribed)
+        """
+        video_id = entry['id']
+        row = self.manifest.video(video_id)
+        recorded = row[0] if row else None
+        
+        # Skip videos whose outcome was settled on a previous run. Videos
+        # without a transcript stay open while their audio transcript is missing
+        retry_audio = download_audio and recorded in ('disabled', 'not_found')
+        if recorded in TERMINAL_STATUSES and recorded != 'success' and not retry_audio:
+            return video_id, 'skipped', None, False, False
             
-            try:
-                status, transcript_data = transcript.download()
-                self._update_stats(status)
-                
-                if transcript_data:
-                    self.successful_transcripts.append(transcript_data)
-                    
-                # Handle audio download if transcript unavailable
-                if download_audio and status in ('disabled', 'not_found'):
-                    print(f"Transcript {status}, attempting audio download...")
-                    audio = Audio(video)
-                    if audio.download():
-                        print("Audio downloaded successfully")
-                        if status == 'disabled':
-                            self.stats['disabled_with_audio'] += 1
-                            self.stats['disabled'] -= 1
-                        else:
-                            self.stats['not_found_with_audio'] += 1
-                            self.stats['not_found'] -= 1
-                            
-            except Exception as e:
-                print(f"\n⚠️ Skipping video {video_id} due to error: {str(e)}")
-                self.stats['skipped'] += 1
-                self.progress['failed'].append({
-                    'video_id': video_id,
-                    'error': str(e),
-                    'retry': True
-                })
-                
-            # Update progress
-            self._update_progress(
-                completed=i,
-                last_processed=video_id,
-                status=f'processing {i}/{total_videos}',
-                stats=self.stats
-            )
+        video = Video(video_id, cookies, self.args.channel_url, preloaded_meta=entry)
+        audio = Audio(video, max_rate=self.args.max_rate) if download_audio else None
+        
+        if retry_audio:
+            if os.path.exists(audio.transcript_path):
+                return video_id, 'skipped', None, False, False
+            status, transcript_data = recorded, None
+        else:
+            # Successful transcripts are read back from disk for the merged output
+            transcript = Transcript(video)
+            status, transcript_data = transcript.download(self._existing)
+            if status != 'skipped':
+                self.manifest.record(video_id, status)
+        
+        # Handle audio download if transcript unavailable; the audio is only
+        # kept for transcription, so stream it straight to WAV
+        audio_ok = False
+        transcribed = False
+        if audio and status in ('disabled', 'not_found'):
+            audio_ok = audio.download_wav()
+            if audio_ok:
+                try:
+                    transcribed = audio.transcribe()
+                except TranscriptionError:
+                    transcribed = False
             
-    def _process_audio_transcripts(self, video_urls: List[str]) -> None:
-        """Process audio transcripts for videos."""
-        print("\nProcessing audio transcripts...")
-        audio_transcripts = 0
-        
-        for url in video_urls:
-            video_id = url.split('/')[-1]
-            audio = Audio(Video(video_id, channel_url=self.args.channel_url))
+        return video_id, status, transcript_data, audio_ok, transcribed
             
-            if audio.transcribe():
-                audio_transcripts += 1
-                
-        print(f"Successfully transcribed {audio_transcripts} audio files")
+    def _append_transcript(self, channel: Channel, transcript_data: Dict[str, Any]) -> None:
+        """Append a transcript to the merged output file, opening it on first use."""
+        if self._output_stream is None:
+            self._output_stream = Output().open_stream(
+                channel.name,
+                self.args.channel_url,
+                self.args.output_format,
+                self.args.output_file
+            )
+        self._output_stream.append(transcript_data)
         
-    def _create_output_file(self, channel_name: str, channel_url: str, output_format: str, filename: Optional[str]) -> Optional[str]:
-        """Create merged output file in specified format."""
-        if not self.successful_transcripts:
+    def _close_output_file(self) -> Optional[str]:
+        """Finalize the merged output file and return its path."""
+        if self._output_stream is None:
             print("No transcripts to merge")
             return None
             
-        output = Output()
-        
-        if output_format == 'html':
-            return output.create_html(
-                channel_name,
-                channel_url,
-                self.successful_transcripts,
-                filename
-            )
-        else:  # markdown
-            return output.create_markdown(
-                channel_name,
-                channel_url,
-                self.successful_transcripts,
-                filename
-            )
+        self._output_stream.close()
+        return self._output_stream.output_file
             
     def _update_progress(self, **kwargs) -> None:
         """Update progress dictionary."""
@@ -318,9 +453,11 @@ class YouTubeTranscriptCLI:
         print(f"- Successfully downloaded transcripts: {self.stats.get('success', 0)}")
         print(f"- Skipped (already exists): {self.stats.get('skipped', 0)}")
         print(f"- Live events skipped: {self.stats.get('live', 0)}")
+        print(f"- Unavailable videos: {self.stats.get('unavailable', 0)}")
         if audio_enabled:
             print(f"- Transcripts disabled (audio downloaded): {self.stats.get('disabled_with_audio', 0)}")
             print(f"- No transcript found (audio downloaded): {self.stats.get('not_found_with_audio', 0)}")
+            print(f"- Audio files transcribed: {self.stats.get('audio_transcripts', 0)}")
         print(f"- Transcripts disabled: {self.stats.get('disabled', 0)}")
         print(f"- No transcript found: {self.stats.get('not_found', 0)}")
         print(f"- Errors: {self.stats.get('error', 0)}")
@@ -1,12 +1,209 @@
 import os
-import re
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Union
 from pathlib import Path
 from .video import Video
 from .transcript import Transcript
 from .audio import Audio
+from .utils.filenames import channel_username, safe_filename
 from .utils.exceptions import OutputError
 
+# Captions ending with one of these close a paragraph
+_SENTENCE_ENDS = ('.', '!', '?')
+
+# Single-pass HTML escaping for text and attribute values
+_HTML_ESC = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+# Large write buffer so each video's section reaches the OS in one write
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# HTML document head, filled with the escaped channel name and URL
+_HTML_HEAD_FMT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Transcripts for %s</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }
+        h1 { color: #333; border-bottom: 1px solid #eee; }
+        h2 { color: #444; margin-top: 30px; }
+        .video-transcript { margin-bottom: 40px; }
+        .separator { border-top: 1px dashed #ccc; margin: 30px 0; }
+    </style>
+</head>
+<body>
+    <h1>Transcripts for YouTube channel: %s</h1>
+    <p>Channel URL: <a href="%s">%s</a></p>
+"""
+
+# Fixed fragments written for every video
+_MD_NO_TRANSCRIPT = "No transcript available for this video.\n\n"
+_MD_SEPARATOR = "---\n\n"
+_HTML_SECTION_OPEN = '\n    <div class="video-transcript">\n        <h2><a href="'
+_HTML_TITLE_OPEN = '">'
+_HTML_TITLE_CLOSE = '</a> '
+_HTML_HEADING_END = '</h2>\n'
+_HTML_NO_TRANSCRIPT = "        <p>No transcript available for this video.</p>\n"
+_HTML_SECTION_END = '    </div>\n    <div class="separator"></div>\n'
+
+
+def _format_date(video_date: Optional[str]) -> str:
+    """Format a YYYYMMDD date as YYYY-MM-DD (empty if unavailable)."""
+    if not video_date:
+        return ''
+    try:
+        return f"{video_date[:4]}-{video_date[4:6]}-{video_date[6:8]}"
+    except:
+        return ''
+
+
+def _paragraphs(transcript_items: List[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Group caption texts into paragraphs that end at sentence boundaries.
+    
+    Captions are streamed into a small buffer that is flushed whenever a
+    caption ends a sentence, so the full transcript text is never built.
+    """
+    buf = []
+    for item in transcript_items:
+        text = item.get('text', '').strip()
+        if not text:
+            continue
+        buf.append(text)
+        if text.endswith(_SENTENCE_ENDS):
+            yield ' '.join(buf)
+            buf.clear()
+    if buf:
+        yield ' '.join(buf)
+
+
+class MarkdownStreamWriter:
+    """Writes a merged markdown file one transcript at a time."""
+    
+    def __init__(self, output_file: str, channel_name: str, channel_url: str):
+        """
+        Create the output file and write its header.
+        
+        Args:
+            output_file: Path to the markdown file
+            channel_name: Name of the YouTube channel
+            channel_url: URL of the YouTube channel
+        """
+        self.output_file = output_file
+        self._f = open(output_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE)
+        
+        # Write header
+        self._f.write(f"# Transcripts for YouTube channel: {channel_name}\n\n")
+        self._f.write(f"Channel URL: {channel_url}\n\n")
+        self._f.flush()
+        
+    def append(self, transcript_data: Dict[str, Any]) -> None:
+        """Write one video's transcript and flush it to disk."""
+        video_title = transcript_data.get('title', 'Unknown Video')
+        video_id = transcript_data.get('video_id', '')
+        video_url = f"https://www.youtube.com/watch?v={video_id}" if video_id else ''
+        
+        # Video header with title, URL and date
+        video_date = _format_date(transcript_data.get('published_date', ''))
+        parts = [f"## [{video_title}]({video_url}) {video_date}\n\n"]
+        
+        # Write transcript text
+        transcript_items = transcript_data.get('transcript', [])
+        if transcript_items:
+            # Split into paragraphs for better readability
+            parts.extend(f"{para}\n\n" for para in _paragraphs(transcript_items))
+        else:
+            parts.append(_MD_NO_TRANSCRIPT)
+        
+        # Add separator between videos
+        parts.append(_MD_SEPARATOR)
+        
+        self._f.writelines(parts)
+        self._f.flush()
+        
+    def close(self) -> None:
+        """Finish and close the output file."""
+        if not self._f.closed:
+            self._f.close()
+            
+    def __enter__(self) -> 'MarkdownStreamWriter':
+        return self
+        
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class HtmlStreamWriter:
+    """Writes a merged HTML file one transcript at a time."""
+    
+    def __init__(self, output_file: str, channel_name: str, channel_url: str):
+        """
+        Create the output file and write the HTML head.
+        
+        Args:
+            output_file: Path to the HTML file
+            channel_name: Name of the YouTube channel
+            channel_url: URL of the YouTube channel
+        """
+        self.output_file = output_file
+        self._f = open(output_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE)
+        
+        # Write HTML header
+        self._f.write(_HTML_HEAD_FMT % tuple(
+            field.translate(_HTML_ESC)
+            for field in (channel_name, channel_name, channel_url, channel_url)
+        ))
+        self._f.flush()
+        
+    def append(self, transcript_data: Dict[str, Any]) -> None:
+        """Write one video's transcript and flush it to disk."""
+        video_title = transcript_data.get('title', 'Unknown Video')
+        video_id = transcript_data.get('video_id', '')
+        video_url = f"https://www.youtube.com/watch?v={video_id}" if video_id else ''
+        
+        # Video section with date
+        video_date = _format_date(transcript_data.get('published_date', ''))
+        parts = [''.join((
+            _HTML_SECTION_OPEN, video_url.translate(_HTML_ESC),
+            _HTML_TITLE_OPEN, video_title.translate(_HTML_ESC),
+            _HTML_TITLE_CLOSE, video_date.translate(_HTML_ESC),
+            _HTML_HEADING_END
+        ))]
+        
+        # Write transcript text
+        transcript_items = transcript_data.get('transcript', [])
+        if transcript_items:
+            # Split into paragraphs
+            parts.extend(
+                f"        <p>{para.translate(_HTML_ESC)}</p>\n"
+                for para in _paragraphs(transcript_items)
+            )
+        else:
+            parts.append(_HTML_NO_TRANSCRIPT)
+        
+        parts.append(_HTML_SECTION_END)
+        
+        self._f.writelines(parts)
+        self._f.flush()
+        
+    def close(self) -> None:
+        """Close the HTML document and the output file."""
+        if not self._f.closed:
+            self._f.write("</body>\n</html>")
+            self._f.close()
+            
+    def __enter__(self) -> 'HtmlStreamWriter':
+        return self
+        
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 class Output:
     """Handles generating output files from transcripts and audio."""
@@ -21,6 +218,51 @@ class Output:
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         
+    def _markdown_path(self, channel_url: str, filename: Optional[str] = None) -> str:
+        """Get the path of the merged markdown file."""
+        return os.path.join(
+            self.output_dir,
+            f"{filename or channel_username(channel_url)}.md"
+        )
+        
+    def _html_path(self, channel_name: str, filename: Optional[str] = None) -> str:
+        """Get the path of the merged HTML file."""
+        # Generate safe filename
+        safe_channel_name = safe_filename(channel_name)
+        
+        if not safe_channel_name:
+            safe_channel_name = "YouTube_Channel"
+            
+        return os.path.join(
+            self.output_dir,
+            f"{filename or safe_channel_name}.html"
+        )
+        
+    def open_stream(
+        self,
+        channel_name: str,
+        channel_url: str,
+        output_format: str = 'markdown',
+        filename: Optional[str] = None
+    ) -> Union[MarkdownStreamWriter, HtmlStreamWriter]:
+        """
+        Open a merged output file that transcripts are appended to as they arrive.
+        
+        Every append is flushed, so partial results survive an interrupted run.
+        
+        Args:
+            channel_name: Name of the YouTube channel
+            channel_url: URL of the YouTube channel
+            output_format: 'markdown' or 'html'
+            filename: Optional custom filename (without extension)
+            
+        Returns:
+            Stream writer with append() and close() methods
+        """
+        if output_format == 'html':
+            return HtmlStreamWriter(self._html_path(channel_name, filename), channel_name, channel_url)
+        return MarkdownStreamWriter(self._markdown_path(channel_url, filename), channel_name, channel_url)
+        
     def create_markdown(
         self,
         channel_name: str,
@@ -43,52 +285,11 @@ class Output:
         if not transcripts:
             raise OutputError("No transcripts provided for markdown generation")
             
-        # Get channel username from URL (after @ symbol)
-        channel_username = channel_url.split('@')[-1].split('/')[0] if '@' in channel_url else 'channel'
-            
-        output_file = os.path.join(
-            self.output_dir,
-            f"{filename or channel_username}.md"
-        )
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write(f"# Transcripts for YouTube channel: {channel_name}\n\n")
-            f.write(f"Channel URL: {channel_url}\n\n")
-            
-            # Process each transcript
+        with self.open_stream(channel_name, channel_url, 'markdown', filename) as writer:
             for transcript_data in transcripts:
-                video_title = transcript_data.get('title', 'Unknown Video')
-                video_id = transcript_data.get('video_id', '')
-                video_url = f"https://www.youtube.com/watch?v={video_id}" if video_id else ''
-                
-                # Video header with title, URL and date
-                video_date = transcript_data.get('published_date', '')
-                if video_date:
-                    try:
-                        # Format YYYYMMDD to YYYY-MM-DD
-                        video_date = f"{video_date[:4]}-{video_date[4:6]}-{video_date[6:8]}"
-                    except:
-                        video_date = ''
-                f.write(f"## [{video_title}]({video_url}) {video_date}\n\n")
-                
-                # Write transcript text
-                transcript_items = transcript_data.get('transcript', [])
-                if transcript_items:
-                    full_text = " ".join(item.get('text', '') for item in transcript_items)
-                    
-                    # Split into paragraphs for better readability
-                    paragraphs = re.split(r'(?<=[.!?])\s+', full_text)
-                    for para in paragraphs:
-                        if para.strip():
-                            f.write(f"{para.strip()}\n\n")
-                else:
-                    f.write("No transcript available for this video.\n\n")
+                writer.append(transcript_data)
                 
-                # Add separator between videos
-                f.write("---\n\n")
-        
-        return output_file
+        return writer.output_file
         
     def create_html(
         self,
@@ -112,78 +313,8 @@ class Output:
         if not transcripts:
             raise OutputError("No transcripts provided for HTML generation")
             
-        # Generate safe filename
-        safe_chars = (' ', '-', '_')
-        safe_channel_name = "".join(
-            c if c.isalnum() or c in safe_chars else '_' 
-            for c in channel_name
-        ).rstrip()
-        
-        if not safe_channel_name:
-            safe_channel_name = "YouTube_Channel"
-            
-        output_file = os.path.join(
-            self.output_dir,
-            f"{filename or safe_channel_name}.html"
-        )
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Write HTML header
-            f.write("""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Transcripts for {}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
-        h1 {{ color: #333; border-bottom: 1px solid #eee; }}
-        h2 {{ color: #444; margin-top: 30px; }}
-        .video-transcript {{ margin-bottom: 40px; }}
-        .separator {{ border-top: 1px dashed #ccc; margin: 30px 0; }}
-    </style>
-</head>
-<body>
-    <h1>Transcripts for YouTube channel: {}</h1>
-    <p>Channel URL: <a href="{}">{}</a></p>
-""".format(channel_name, channel_name, channel_url, channel_url))
-            
-            # Process each transcript
+        with self.open_stream(channel_name, channel_url, 'html', filename) as writer:
             for transcript_data in transcripts:
-                video_title = transcript_data.get('title', 'Unknown Video')
-                video_id = transcript_data.get('video_id', '')
-                video_url = f"https://www.youtube.com/watch?v={video_id}" if video_id else ''
-                
-                # Video section with date
-                video_date = transcript_data.get('published_date', '')
-                if video_date:
-                    try:
-                        # Format YYYYMMDD to YYYY-MM-DD
-                        video_date = f"{video_date[:4]}-{video_date[4:6]}-{video_date[6:8]}"
-                    except:
-                        video_date = ''
-                f.write(f"""
-    <div class="video-transcript">
-        <h2><a href="{video_url}">{video_title}</a> {video_date}</h2>
-""")
+                writer.append(transcript_data)
                 
-                # Write transcript text
-                transcript_items = transcript_data.get('transcript', [])
-                if transcript_items:
-                    full_text = " ".join(item.get('text', '') for item in transcript_items)
-                    
-                    # Split into paragraphs
-                    paragraphs = re.split(r'(?<=[.!?])\s+', full_text)
-                    for para in paragraphs:
-                        if para.strip():
-                            f.write(f"        <p>{para.strip()}</p>\n")
-                else:
-                    f.write("        <p>No transcript available for this video.</p>\n")
-                
-                f.write("    </div>\n")
-                f.write('    <div class="separator"></div>\n')
-            
-            # Close HTML
-            f.write("</body>\n</html>")
-        
-        return output_file
+        return writer.output_file
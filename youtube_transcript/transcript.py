@@ -1,10 +1,17 @@
 import os
 import json
 import time
-from typing import Optional, Tuple, Dict, Any
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Tuple, Dict, Any, List, Iterable, Iterator, Set
+import zstandard
 from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+from youtube_transcript_api._errors import (
+    TranscriptsDisabled as ApiTranscriptsDisabled,
+    NoTranscriptFound as ApiNoTranscriptFound
+)
 from .video import Video
+from .utils.filenames import channel_username
 from .utils.exceptions import (
     TranscriptError,
     TranscriptsDisabled,
@@ -12,6 +19,52 @@ from .utils.exceptions import (
     InvalidVideoError
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-video transcript files are stored as zstd-compressed JSON; files
+# written by older versions are plain JSON and are migrated when read
+_ZSTD_LEVEL = 3
+_TRANSCRIPT_EXT = '.json.zst'
+_LEGACY_EXT = '.json'
+
+# Download statuses for the error types saved by Transcript
+_ERROR_STATUSES = {
+    'live_event': 'live',
+    'video_unavailable': 'unavailable',
+    'transcripts_disabled': 'disabled',
+    'no_transcript_found': 'not_found'
+}
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode data as zstd-compressed JSON, using orjson when available."""
+    if orjson is not None:
+        raw = orjson.dumps(data)
+    else:
+        raw = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw)
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Decode JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _loads(packed: bytes) -> Any:
+    """Decode zstd-compressed JSON, using orjson when available."""
+    return _loads_json(zstandard.ZstdDecompressor().decompress(packed))
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process."""
+    os.makedirs(path, exist_ok=True)
+
 
 class Transcript:
     """Handles YouTube transcript downloading and processing."""
@@ -28,33 +81,117 @@ class Transcript:
         self.output_dir = output_dir
         self._transcript_data = None
         
+        channel_subfolder = self.channel_subfolder(video.channel_url, output_dir)
+        _ensure_dir(channel_subfolder)
+        self._transcript_path = os.path.join(
+            channel_subfolder,
+            f'{video.video_id}{_TRANSCRIPT_EXT}'
+        )
+        self._legacy_path = os.path.join(
+            channel_subfolder,
+            f'{video.video_id}{_LEGACY_EXT}'
+        )
+        
+    @staticmethod
+    def channel_subfolder(channel_url: str, output_dir: str = 'output') -> str:
+        """
+        Get the directory holding a channel's transcript files.
+        
+        Args:
+            channel_url: URL of the YouTube channel
+            output_dir: Base directory for transcript storage
+            
+        Returns:
+            Path of the channel's transcript directory
+        """
+        return os.path.join(output_dir, channel_username(channel_url))
+        
+    @classmethod
+    def preload_existing(cls, channel_subfolder: str) -> Set[str]:
+        """
+        List the video IDs that already have a transcript file.
+        
+        Scanning the directory once replaces a failed open per new video
+        when deciding what to download.
+        
+        Args:
+            channel_subfolder: Channel transcript directory
+            
+        Returns:
+            Set of video IDs with a stored transcript or error status,
+            including legacy plain JSON files
+        """
+        existing = set()
+        try:
+            with os.scandir(channel_subfolder) as entries:
+                for entry in entries:
+                    for ext in (_TRANSCRIPT_EXT, _LEGACY_EXT):
+                        if entry.name.endswith(ext):
+                            existing.add(entry.name[:-len(ext)])
+                            break
+        except FileNotFoundError:
+            pass
+        return existing
+        
     @property
     def transcript_path(self) -> str:
         """Get the full path where transcript should be stored."""
-        # Get channel username from URL (after @ symbol)
-        channel_url = self.video.channel_url
-        channel_username = channel_url.split('@')[-1].split('/')[0] if '@' in channel_url else 'channel'
+        return self._transcript_path
         
-        channel_subfolder = os.path.join(self.output_dir, channel_username)
-        os.makedirs(channel_subfolder, exist_ok=True)
-        return os.path.join(
-            channel_subfolder,
-            f'{self.video.video_id}.json'
-        )
+    def _read_stored(self) -> Dict[str, Any]:
+        """
+        Read the stored transcript file.
         
-    def download(self) -> Tuple[str, Optional[Dict[str, Any]]]:
+        A legacy plain JSON file is read instead when there is no compressed
+        one, and is rewritten in the compressed format.
+        
+        Raises:
+            FileNotFoundError: If the video has no stored file
+        """
+        try:
+            with open(self.transcript_path, 'rb') as f:
+                return _loads(f.read())
+        except FileNotFoundError:
+            pass
+            
+        with open(self._legacy_path, 'rb') as f:
+            data = _loads_json(f.read())
+            
+        try:
+            self._store(data)
+            os.remove(self._legacy_path)
+        except OSError:
+            pass
+        return data
+        
+    def _store(self, data: Dict[str, Any]) -> None:
+        """Write data to the transcript file atomically."""
+        # Save to temporary file first, then atomically move into place
+        temp_path = f'{self.transcript_path}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(_dumps(data))
+            
+        os.replace(temp_path, self.transcript_path)
+        
+    def download(self, existing: Optional[Set[str]] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
         """
         Download and save transcript for the video.
         
+        Args:
+            existing: Video IDs known to have a transcript file, as returned
+                by preload_existing; when given, the file is only opened for
+                videos in the set
+        
         Returns:
             Tuple of (status, transcript_data)
-            Status can be: 'success', 'skipped', 'disabled', 'not_found', 'error'
+            Status can be: 'success', 'skipped', 'live', 'unavailable',
+            'disabled', 'not_found', 'error'
         """
-        if os.path.exists(self.transcript_path):
+        if existing is None or self.video.video_id in existing:
             try:
-                with open(self.transcript_path, 'r') as f:
-                    existing_data = json.load(f)
-                    return 'skipped', existing_data
+                return 'skipped', self._read_stored()
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 return 'skipped', None
                 
@@ -79,21 +216,12 @@ class Transcript:
                 'transcript': transcript
             }
             
-            # Save to temporary file first
-            temp_path = f'{self.transcript_path}.tmp'
-            with open(temp_path, 'w') as f:
-                json.dump(self._transcript_data, f, indent=2)
-                
-            # Verify and rename
-            if not os.path.exists(temp_path):
-                raise TranscriptError("Failed to write transcript file")
-                
-            os.rename(temp_path, self.transcript_path)
+            self._store(self._transcript_data)
             return 'success', self._transcript_data
             
-        except TranscriptsDisabled:
+        except (ApiTranscriptsDisabled, TranscriptsDisabled):
             return self._save_error_status('transcripts_disabled')
-        except NoTranscriptFound:
+        except (ApiNoTranscriptFound, NoTranscriptFound):
             return self._save_error_status('no_transcript_found')
         except Exception as e:
             return self._save_error_status(str(e))
@@ -107,23 +235,43 @@ class Transcript:
             'published_date': self.video.published_date
         }
         
-        with open(self.transcript_path, 'w') as f:
-            json.dump(error_data, f)
-            
-        return error_type.split('_')[0] if '_' in error_type else 'error', None
+        self._store(error_data)
+        return _ERROR_STATUSES.get(error_type, 'error'), None
         
     def get_transcript_text(self) -> Optional[str]:
         """Get the full transcript text if available."""
         if self._transcript_data is None:
-            if not os.path.exists(self.transcript_path):
+            try:
+                data = self._read_stored()
+            except FileNotFoundError:
                 return None
                 
-            with open(self.transcript_path, 'r') as f:
-                data = json.load(f)
-                
             if 'transcript' not in data:
                 return None
                 
             self._transcript_data = data
             
-        return ' '.join(item['text'] for item in self._transcript_data['transcript'])
+        return ' '.join([item['text'] for item in self._transcript_data['transcript'] if 'text' in item])
+
+
+def download_many(
+    transcripts: Iterable[Transcript],
+    max_workers: int = 16
+) -> Iterator[Tuple[Transcript, Tuple[str, Optional[Dict[str, Any]]]]]:
+    """
+    Download several transcripts concurrently.
+    
+    Downloads are network-bound, so running them on a thread pool keeps
+    several requests in flight at once.
+    
+    Args:
+        transcripts: Transcript instances to download
+        max_workers: Maximum number of concurrent downloads
+        
+    Yields:
+        Tuples of (transcript, download result) in completion order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {ex.submit(t.download): t for t in transcripts}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import functools
+import threading
+from typing import Any, Callable
+
+# How long a cached channel ID/name stays valid
+CHANNEL_CACHE_TTL = 30 * 24 * 60 * 60
+
+# How long cached video metadata stays valid
+VIDEO_INFO_TTL = 24 * 60 * 60
+
+# Per-thread memoization connections, and the database files whose schema
+# this process has already created
+_memo_local = threading.local()
+_memo_schema_paths = set()
+_memo_schema_lock = threading.Lock()
+
+
+def user_cache_dir() -> str:
+    """Get the per-user cache directory for this package."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'youtube-transcript')
+
+
+def _cache_key(text: str) -> str:
+    """Hash text (such as a URL) into a compact cache key."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open the cache database, creating it if needed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS channels ('
+        'url_hash TEXT PRIMARY KEY, id TEXT NOT NULL, '
+        'name TEXT NOT NULL, fetched_at REAL NOT NULL)'
+    )
+    return conn
+
+
+def cached_channel_info(fetch: Callable[..., None]) -> Callable[..., None]:
+    """
+    Cache a Channel's ID and name on disk, keyed by its URL.
+
+    Wraps ``Channel._fetch_channel_info``. On a fresh hit the channel's ``_id``
+    and ``_name`` are filled from the cache and yt-dlp is never called. Caching
+    is skipped when the channel was created with ``use_cache=False``, and
+    cache failures never stop the channel from being fetched.
+    """
+    @functools.wraps(fetch)
+    def wrapper(self) -> None:
+        if not self.use_cache:
+            return fetch(self)
+
+        path = os.path.join(user_cache_dir(), 'channel.sqlite')
+        key = _cache_key(self.url)
+        try:
+            conn = _connect(path)
+        except (sqlite3.Error, OSError):
+            return fetch(self)
+
+        try:
+            try:
+                row = conn.execute(
+                    'SELECT id, name, fetched_at FROM channels WHERE url_hash = ?',
+                    (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row and time.time() - row[2] < CHANNEL_CACHE_TTL:
+                self._id, self._name = row[0], row[1]
+                return
+
+            fetch(self)
+            if self._id is None or self._name is None:
+                return
+            try:
+                conn.execute(
+                    'INSERT OR REPLACE INTO channels (url_hash, id, name, fetched_at) '
+                    'VALUES (?, ?, ?, ?)',
+                    (key, self._id, self._name, time.time())
+                )
+            except sqlite3.Error:
+                pass
+        finally:
+            conn.close()
+
+    return wrapper
+
+
+def _create_memo_schema(conn: sqlite3.Connection, path: str) -> None:
+    """Create the memoization table, once per database file per process."""
+    with _memo_schema_lock:
+        if path in _memo_schema_paths:
+            return
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS memo ('
+            'key TEXT PRIMARY KEY, namespace TEXT NOT NULL, value TEXT NOT NULL, '
+            'stored_at REAL NOT NULL)'
+        )
+        _memo_schema_paths.add(path)
+
+
+def _connect_memo(path: str) -> sqlite3.Connection:
+    """
+    Get the calling thread's connection to the memoization database.
+
+    Connections are kept per thread and per path, so memoized calls reuse
+    one connection instead of opening the database each time.
+    """
+    conns = getattr(_memo_local, 'conns', None)
+    if conns is None:
+        conns = _memo_local.conns = {}
+    conn = conns.get(path)
+    if conn is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path, isolation_level=None, timeout=30)
+        _create_memo_schema(conn, path)
+        conns[path] = conn
+    return conn
+
+
+def disk_memoize(namespace: str, ttl: float) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Memoize a function's JSON-serializable result on disk.
+
+    Results are keyed by the namespace and the positional arguments and
+    expire after ``ttl`` seconds; expired entries are deleted whenever a new
+    result is stored. Exceptions are not cached, and cache failures fall back
+    to calling the function.
+
+    Args:
+        namespace: Name separating this function's entries from others
+        ttl: Seconds a cached result stays valid
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args):
+            path = os.path.join(user_cache_dir(), 'memo.sqlite')
+            key = _cache_key(json.dumps([namespace, args], default=str))
+            try:
+                conn = _connect_memo(path)
+            except (sqlite3.Error, OSError):
+                return func(*args)
+
+            try:
+                row = conn.execute(
+                    'SELECT value, stored_at FROM memo WHERE key = ?', (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row and time.time() - row[1] < ttl:
+                return json.loads(row[0])
+
+            value = func(*args)
+            now = time.time()
+            try:
+                # Drop this namespace's expired entries so the file stays bounded
+                conn.execute(
+                    'DELETE FROM memo WHERE namespace = ? AND stored_at < ?',
+                    (namespace, now - ttl)
+                )
+                conn.execute(
+                    'INSERT OR REPLACE INTO memo (key, namespace, value, stored_at) '
+                    'VALUES (?, ?, ?, ?)',
+                    (key, namespace, json.dumps(value), now)
+                )
+            except sqlite3.Error:
+                pass
+            return value
+
+        return wrapper
+
+    return decorator
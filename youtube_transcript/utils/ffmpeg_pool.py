@@ -0,0 +1,59 @@
+import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List
+
+
+class FfmpegPool:
+    """Shared, bounded pool of ffmpeg conversions to speech-ready WAV chunks."""
+
+    def __init__(self, workers: int = 4, segment_time: int = 60):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Maximum number of ffmpeg processes running at once
+            segment_time: Length in seconds of each output WAV segment
+        """
+        self.segment_time = segment_time
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ffmpeg')
+
+    def command(self, input_path: str, output_pattern: str) -> List[str]:
+        """
+        Build the ffmpeg command for a conversion.
+
+        Decoding, resampling to 16 kHz mono PCM and segmenting all happen in a
+        single process, so each input costs one exec instead of one per step.
+        """
+        return [
+            'ffmpeg',
+            '-nostdin',
+            '-hide_banner',
+            '-loglevel', 'error',
+            '-y',  # Overwrite without asking
+            '-i', input_path,
+            '-ac', '1',  # Mono channel
+            '-ar', '16000',  # 16kHz sample rate
+            '-acodec', 'pcm_s16le',  # WAV format
+            '-f', 'segment',
+            '-segment_time', str(self.segment_time),
+            output_pattern
+        ]
+
+    def submit(self, input_path: str, output_pattern: str) -> Future:
+        """
+        Queue a conversion.
+
+        Args:
+            input_path: Audio file to convert
+            output_pattern: Segment output pattern, e.g. ``chunks/%04d.wav``
+
+        Returns:
+            Future that raises CalledProcessError if ffmpeg fails
+        """
+        return self._executor.submit(
+            subprocess.run, self.command(input_path, output_pattern), check=True
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and optionally wait for queued conversions."""
+        self._executor.shutdown(wait=wait)
@@ -1,7 +1,41 @@
 import os
 import re
-from typing import List, Tuple, Optional
-from pathlib import Path
+import itertools
+from typing import Callable, Iterator, List, Tuple, Optional, TextIO
+
+# H2 section markers, found with plain substring search. A Markdown H2 is
+# "\n##" followed by any whitespace, as in the regex r'\n##\s'
+_H2_MD_MARKER = '\n##'
+_H2_HTML_MARKERS = ('<h2', '<H2')
+
+# Paragraph and sentence boundaries, compiled once
+_DBL_NL_RE = re.compile(r'(?<=\n\n)')
+_PARA_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _find_all(content: str, markers: Tuple[str, ...]) -> List[int]:
+    """Find the sorted start offsets of every occurrence of the markers."""
+    starts = []
+    for marker in markers:
+        pos = content.find(marker)
+        while pos >= 0:
+            starts.append(pos)
+            pos = content.find(marker, pos + 1)
+    starts.sort()
+    return starts
+
+
+def _find_md_h2(content: str) -> List[int]:
+    """Find the start offsets of every Markdown H2 heading line."""
+    starts = []
+    after = len(_H2_MD_MARKER)
+    pos = content.find(_H2_MD_MARKER)
+    while pos >= 0:
+        if content[pos + after:pos + after + 1].isspace():
+            starts.append(pos)
+        pos = content.find(_H2_MD_MARKER, pos + 1)
+    return starts
+
 
 class FileSplitter:
     """Utility class for splitting large files while preserving H2 sections."""
@@ -28,11 +62,12 @@ class FileSplitter:
         Returns:
             List of paths to created output files
         """
-        input_path = Path(input_path)
+        input_path = str(input_path)
         if not output_dir:
-            output_dir = input_path.parent
+            output_dir = os.path.dirname(input_path)
         else:
-            output_dir = Path(output_dir)
+            output_dir = str(output_dir)
+        stem, suffix = os.path.splitext(os.path.basename(input_path))
             
         # Read input file
         with open(input_path, 'r', encoding='utf-8') as f:
@@ -41,18 +76,15 @@ class FileSplitter:
         # Split into H2 sections
         sections = self._split_into_sections(content)
         
-        # Group sections into chunks that fit size constraints
-        chunks = self._create_chunks(sections)
+        # Output files are opened on demand as the chunks are written
+        part_numbers = itertools.count(1)
         
-        # Write chunks to files
-        output_files = []
-        for i, chunk in enumerate(chunks, 1):
-            output_path = output_dir / f"{input_path.stem}_part{i}{input_path.suffix}"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(chunk)
-            output_files.append(str(output_path))
+        def open_next_file() -> TextIO:
+            output_path = os.path.join(output_dir, f"{stem}_part{next(part_numbers)}{suffix}")
+            return open(output_path, 'w', encoding='utf-8')
             
-        return output_files
+        # Stream sections into files that fit size constraints
+        return list(self._emit_chunks(sections, open_next_file))
         
     def _split_into_sections(self, content: str) -> List[Tuple[str, int]]:
         """
@@ -64,102 +96,70 @@ class FileSplitter:
         Returns:
             List of (section_content, section_size) tuples
         """
-        # Try Markdown H2 first (##)
-        markdown_sections = re.split(r'(?=\n##\s)', content)
-        if len(markdown_sections) > 1:
-            return [(s, len(s.encode('utf-8'))) for s in markdown_sections]
-            
-        # Fall back to HTML H2
-        html_sections = re.split(r'(?=<h2[^>]*>)', content, flags=re.IGNORECASE)
-        if len(html_sections) > 1:
-            return [(s, len(s.encode('utf-8'))) for s in html_sections]
+        # Try Markdown H2 first (##), then fall back to HTML H2
+        starts = _find_md_h2(content) or _find_all(content, _H2_HTML_MARKERS)
+        if starts:
+            bounds = [0] + starts + [len(content)]
+            sections = [content[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+            return [(s, len(s.encode('utf-8'))) for s in sections]
             
         # No H2 sections found - treat whole content as one section
         return [(content, len(content.encode('utf-8')))]
         
-    def _create_chunks(self, sections: List[Tuple[str, int]]) -> List[str]:
+    def _emit_chunks(
+        self,
+        sections: List[Tuple[str, int]],
+        open_next_file: Callable[[], TextIO]
+    ) -> Iterator[str]:
         """
-        Combine sections into chunks that fit size constraints.
+        Write sections into files that fit size constraints.
+        
+        Pieces are written as soon as they are placed, so no chunk is ever
+        joined in memory.
         
         Args:
             sections: List of (content, size) tuples
+            open_next_file: Called to open the file for each new chunk
             
-        Returns:
-            List of chunk contents
+        Yields:
+            Path of each output file once it has been written and closed
         """
-        chunks = []
-        current_chunk = []
+        # A greedy pass is already optimal here: a chunk is only closed when
+        # the next piece would not fit, so no two adjacent chunks could merge
+        current_file = None
         current_size = 0
         current_length = 0
         
-        for section, size in sections:
-            section_length = len(section)
-            
-            # If section alone exceeds limits, we have to split it
-            if size > self.max_bytes or section_length > self.max_chars:
-                # Split the oversized section into smaller parts
-                split_sections = self._split_oversized_section(section)
-                for sub_section, sub_size in split_sections:
-                    sub_length = len(sub_section)
-                    if (current_size + sub_size > self.max_bytes or 
-                        current_length + sub_length > self.max_chars):
-                        if current_chunk:  # Only create new chunk if we have content
-                            chunks.append(''.join(current_chunk))
-                        current_chunk = [sub_section]
-                        current_size = sub_size
-                        current_length = sub_length
-                    else:
-                        current_chunk.append(sub_section)
-                        current_size += sub_size
-                        current_length += sub_length
-            else:
-                # Try to add to current chunk if possible
-                if (current_size + size > self.max_bytes or 
-                    current_length + section_length > self.max_chars):
-                    if current_chunk:  # Only create new chunk if we have content
-                        chunks.append(''.join(current_chunk))
-                    current_chunk = [section]
-                    current_size = size
-                    current_length = section_length
+        try:
+            for section, size in sections:
+                # If section alone exceeds limits, we have to split it
+                if size > self.max_bytes or len(section) > self.max_chars:
+                    pieces = self._split_oversized_section(section)
                 else:
-                    current_chunk.append(section)
-                    current_size += size
-                    current_length += section_length
+                    pieces = ((section, size),)
                     
-        if current_chunk:
-            chunks.append(''.join(current_chunk))
-            
-        # Optimize chunk sizes by redistributing content if we have many small chunks
-        if len(chunks) > 1:
-            optimized_chunks = []
-            temp_chunk = []
-            temp_size = 0
-            temp_length = 0
-            
-            for chunk in chunks:
-                chunk_size = len(chunk.encode('utf-8'))
-                chunk_length = len(chunk)
-                
-                if (temp_size + chunk_size > self.max_bytes or
-                    temp_length + chunk_length > self.max_chars):
-                    if temp_chunk:
-                        optimized_chunks.append(''.join(temp_chunk))
-                    temp_chunk = [chunk]
-                    temp_size = chunk_size
-                    temp_length = chunk_length
-                else:
-                    temp_chunk.append(chunk)
-                    temp_size += chunk_size
-                    temp_length += chunk_length
-            
-            if temp_chunk:
-                optimized_chunks.append(''.join(temp_chunk))
-                
-            # Only return optimized chunks if we actually reduced the number
-            if len(optimized_chunks) < len(chunks):
-                return optimized_chunks
-                
-        return chunks
+                for piece, piece_size in pieces:
+                    piece_length = len(piece)
+                    if (current_file is None or
+                        current_size + piece_size > self.max_bytes or 
+                        current_length + piece_length > self.max_chars):
+                        if current_file is not None:
+                            current_file.close()
+                            yield current_file.name
+                        current_file = open_next_file()
+                        current_size = 0
+                        current_length = 0
+                        
+                    current_file.write(piece)
+                    current_size += piece_size
+                    current_length += piece_length
+                    
+            if current_file is not None:
+                current_file.close()
+                yield current_file.name
+        finally:
+            if current_file is not None and not current_file.closed:
+                current_file.close()
         
     def _split_oversized_section(self, section: str) -> List[Tuple[str, int]]:
         """
@@ -172,12 +172,12 @@ class FileSplitter:
             List of (content, size) tuples
         """
         # Split by paragraphs first
-        paragraphs = re.split(r'(?<=\n\n)', section)
+        paragraphs = _DBL_NL_RE.split(section)
         if len(paragraphs) > 1:
             return [(p, len(p.encode('utf-8'))) for p in paragraphs]
             
         # Fall back to splitting by sentences
-        sentences = re.split(r'(?<=[.!?])\s+', section)
+        sentences = _PARA_RE.split(section)
         if len(sentences) > 1:
             return [(s, len(s.encode('utf-8'))) for s in sentences]
             
@@ -0,0 +1,35 @@
+import re
+
+# Characters kept in filenames; everything else becomes '_'
+_SAFE_RE = re.compile(r'[^\w \-]')
+
+
+def safe_filename(name: str) -> str:
+    """
+    Make a string safe to use as a filename.
+    
+    Letters, digits, spaces, hyphens and underscores are kept; every other
+    character is replaced by '_' and trailing whitespace is stripped.
+    
+    Args:
+        name: String to sanitize, such as a video title
+        
+    Returns:
+        Sanitized string (may be empty)
+    """
+    return _SAFE_RE.sub('_', name).rstrip()
+
+
+def channel_username(channel_url: str) -> str:
+    """
+    Get the channel handle used to name a channel's files.
+    
+    Args:
+        channel_url: URL of the YouTube channel, such as
+            https://www.youtube.com/@name/videos
+        
+    Returns:
+        The handle after the '@' symbol, or 'channel' if the URL has none
+    """
+    _, sep, rest = channel_url.rpartition('@')
+    return rest.partition('/')[0] if sep else 'channel'
@@ -0,0 +1,79 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+# Statuses that will not change on a re-run, so the video can be skipped
+TERMINAL_STATUSES = ('success', 'disabled', 'not_found', 'live', 'unavailable')
+
+
+class Manifest:
+    """Persistent record of per-video processing status for a channel."""
+
+    def __init__(self, path: str, channel_url: str):
+        """
+        Open (or create) the manifest database.
+
+        Args:
+            path: Path to the SQLite manifest file
+            channel_url: URL of the channel being processed; entries recorded
+                for a different channel are treated as stale
+        """
+        self.path = path
+        self.url_hash = hashlib.sha256(channel_url.encode('utf-8')).hexdigest()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS videos ('
+            'video_id TEXT PRIMARY KEY, status TEXT NOT NULL, '
+            'url_hash TEXT NOT NULL, mtime REAL NOT NULL)'
+        )
+
+    def video(self, video_id: str) -> Optional[Tuple[str, str, float]]:
+        """
+        Look up the recorded status of a video.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Tuple of (status, url_hash, mtime), or None if the video has no
+            entry or the entry belongs to a different channel
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT status, url_hash, mtime FROM videos WHERE video_id = ?',
+                (video_id,)
+            ).fetchone()
+
+        if row is None or row[1] != self.url_hash:
+            return None
+        return row
+
+    def record(self, video_id: str, status: str) -> None:
+        """
+        Record the processing status of a video.
+
+        Args:
+            video_id: YouTube video ID
+            status: Status returned by the transcript download
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO videos (video_id, status, url_hash, mtime) '
+                'VALUES (?, ?, ?, ?)',
+                (video_id, status, self.url_hash, time.time())
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
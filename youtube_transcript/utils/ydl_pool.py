@@ -0,0 +1,68 @@
+import json
+import threading
+from typing import Any, Dict, Iterable, List
+import yt_dlp
+
+_local = threading.local()
+
+# Every thread's instance cache, so close_all() can reach all of them
+_caches: List[Dict[str, yt_dlp.YoutubeDL]] = []
+_caches_lock = threading.Lock()
+
+
+def _opts_key(ydl_opts: Dict[str, Any], volatile: Iterable[str]) -> str:
+    """Build a stable cache key from options, ignoring volatile keys."""
+    stable = {k: v for k, v in ydl_opts.items() if k not in volatile}
+    return json.dumps(stable, sort_keys=True, default=repr)
+
+
+def get_ydl(ydl_opts: Dict[str, Any], volatile: Iterable[str] = ()) -> yt_dlp.YoutubeDL:
+    """
+    Get a YoutubeDL instance for the current thread, reusing it across calls.
+
+    Building a YoutubeDL loads extractors and sets up a fresh HTTP connection
+    pool, so instances are cached per thread and per set of options.
+
+    Args:
+        ydl_opts: yt-dlp options
+        volatile: Option keys that change from call to call; they are left
+            out of the cache key and applied to the cached instance instead
+
+    Returns:
+        YoutubeDL instance owned by the calling thread
+    """
+    volatile = tuple(volatile)
+    instances = getattr(_local, 'instances', None)
+    if instances is None:
+        instances = _local.instances = {}
+        with _caches_lock:
+            _caches.append(instances)
+
+    key = _opts_key(ydl_opts, volatile)
+    ydl = instances.get(key)
+    if ydl is None:
+        ydl = instances[key] = yt_dlp.YoutubeDL(ydl_opts)
+    else:
+        ydl.params.update({k: ydl_opts[k] for k in volatile if k in ydl_opts})
+
+    return ydl
+
+
+def close_all() -> None:
+    """
+    Close every YoutubeDL instance created by get_ydl, in all threads.
+    
+    Closing saves each instance's cookie jar back to its ``cookiefile``, as
+    leaving a ``with yt_dlp.YoutubeDL(...)`` block would. Call this once no
+    thread is using its instances anymore; later get_ydl calls build new ones.
+    """
+    with _caches_lock:
+        caches = list(_caches)
+        
+    for instances in caches:
+        while instances:
+            _, ydl = instances.popitem()
+            try:
+                ydl.__exit__(None, None, None)
+            except Exception:
+                pass
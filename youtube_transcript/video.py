@@ -1,12 +1,50 @@
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
 import yt_dlp
+from .utils.cache import disk_memoize, VIDEO_INFO_TTL
+from .utils.ydl_pool import get_ydl
+from .utils.filenames import safe_filename
 from .utils.exceptions import InvalidVideoError, CookieError
 
 
+@disk_memoize('video_info', VIDEO_INFO_TTL)
+def _extract_info(video_url: str, cookies: Optional[str]) -> Dict[str, Any]:
+    """
+    Fetch the video metadata fields used by Video.
+    
+    Only a small plain dict is returned so it can be cached on disk.
+    """
+    ydl_opts = {
+        'quiet': True,
+        'skip_download': True
+    }
+    
+    if cookies:
+        ydl_opts['cookiefile'] = cookies
+        
+    info = get_ydl(ydl_opts).extract_info(video_url, download=False)
+    
+    unavailable = info.get('availability') == 'unavailable' or 'Video unavailable' in str(info)
+    return {
+        'title': info.get('title'),
+        'is_live': info.get('is_live'),
+        'live_status': info.get('live_status'),
+        'availability': 'unavailable' if unavailable else info.get('availability'),
+        'upload_date': info.get('upload_date'),
+        'timestamp': info.get('timestamp')
+    }
+
+
 class Video:
     """Handles YouTube video information and operations."""
     
-    def __init__(self, video_id: str, cookies: Optional[str] = None, channel_url: Optional[str] = None):
+    def __init__(
+        self,
+        video_id: str,
+        cookies: Optional[str] = None,
+        channel_url: Optional[str] = None,
+        preloaded_meta: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize with video ID and optional cookies file.
         
@@ -14,6 +52,8 @@ class Video:
             video_id: YouTube video ID
             cookies: Path to cookies file for authenticated requests
             channel_url: URL of the YouTube channel this video belongs to
+            preloaded_meta: Video entry from a channel listing; avoids a
+                per-video metadata request when it carries the needed fields
         """
         self.video_id = video_id
         self.cookies = cookies
@@ -23,6 +63,9 @@ class Video:
         self._is_unavailable = None
         self._published_date = None
         
+        if preloaded_meta:
+            self._load_info(preloaded_meta)
+        
     @property
     def url(self) -> str:
         """Get the full YouTube URL for this video."""
@@ -51,29 +94,8 @@ class Video:
         
     def _fetch_video_info(self) -> None:
         """Fetch and cache video information."""
-        ydl_opts = {
-            'quiet': True,
-            'skip_download': True
-        }
-        
-        if self.cookies:
-            ydl_opts['cookiefile'] = self.cookies
-            
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=False)
-                
-                # Get video title (sanitize for filesystem)
-                self._title = info.get('title', 'unknown').replace('/', '-').replace('\\', '-')[:100]
-                
-                # Check live status
-                self._is_live = info.get('is_live') or info.get('live_status') in ('upcoming', 'live')
-                
-                # Check availability
-                self._is_unavailable = info.get('availability') == 'unavailable' or 'Video unavailable' in str(info)
-                
-                # Get published date
-                self._published_date = info.get('upload_date')
+            self._load_info(_extract_info(self.url, self.cookies))
                 
         except yt_dlp.utils.DownloadError as e:
             if 'Video unavailable' in str(e):
@@ -86,6 +108,24 @@ class Video:
                 raise CookieError(f"Cookie error: {e}") from e
             raise InvalidVideoError(f"Error getting video info: {e}") from e
             
+    def _load_info(self, info: Dict[str, Any]) -> None:
+        """Cache video information from a yt-dlp info dict."""
+        # Get video title (sanitize for filesystem)
+        self._title = (info.get('title') or 'unknown').replace('/', '-').replace('\\', '-')[:100]
+        
+        # Check live status
+        self._is_live = bool(info.get('is_live') or info.get('live_status') in ('upcoming', 'live'))
+        
+        # Check availability
+        self._is_unavailable = info.get('availability') == 'unavailable' or 'Video unavailable' in str(info)
+        
+        # Get published date (flat playlist entries may only carry a timestamp)
+        upload_date = info.get('upload_date')
+        if not upload_date and info.get('timestamp'):
+            upload_date = datetime.fromtimestamp(info['timestamp'], tz=timezone.utc).strftime('%Y%m%d')
+        # An empty string marks the date as unknown without fetching again
+        self._published_date = upload_date or ''
+            
     @property
     def published_date(self) -> Optional[str]:
         """Get video published date (fetches if not already cached)."""
@@ -100,10 +140,6 @@ class Video:
         Returns:
             Safe title string with special characters replaced
         """
-        safe_chars = (' ', '-', '_')
-        safe_title = "".join(
-            c if c.isalnum() or c in safe_chars else '_' 
-            for c in self.title
-        ).rstrip()
+        safe_title = safe_filename(self.title)
         
         return safe_title[:100] if safe_title else f"video_{self.video_id}"